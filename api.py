@@ -1,26 +1,266 @@
+import io
 import os
+import email.utils
 import time
+import logging
+import uuid
+import mimetypes
+import shutil
+import random
+import threading
+import httpx
 import requests
 import concurrent.futures
-from typing import List, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional, Union, BinaryIO
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Job statuses after which a job never changes again
+TERMINAL_STATUSES = ("completed", "failed", "error")
+# Assets are fetched in byte ranges of at least this size, several ranges at a time
+DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+DOWNLOAD_WORKERS = 8
+# JSON outputs smaller than this can be returned inline instead of written to disk
+INLINE_JSON_MAX_SIZE = 1024 * 1024
+# Buffer size used when copying response bodies to disk
+COPY_BUFFER_SIZE = 1024 * 1024
+# Transient HTTP statuses retried by both transports, and how often
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 5
+
+
+def _asset_ext(name: str) -> str:
+    """Extension of an output asset name, defaulting to wav."""
+    _, dot, ext = name.rpartition(".")
+    return ext if dot and ext else "wav"
+
+
+def _check_cancelled(job_id: str, cancel: threading.Event) -> None:
+    """Raise once *cancel* has been set, so a waiter gives up on its job."""
+    if cancel is not None and cancel.is_set():
+        raise RuntimeError(f"Job {job_id} cancelled")
+
+
+def _raise_job_failure(job_id: str, job_info: dict) -> None:
+    # Get more detailed error information
+    status = job_info["status"]
+    error_details = job_info.get("error", "No error details available")
+    error_message = job_info.get("errorMessage", "No error message available")
+    logger.error("❌ Job %s failed with status: %s", job_id, status)
+    logger.error("❌ Error details: %s", error_details)
+    logger.error("❌ Error message: %s", error_message)
+    raise RuntimeError(f"Job {job_id} failed: {status}. Details: {error_details}. Message: {error_message}")
+
+
+def _job_finished(job_id: str, job_info: dict, start: float, timeout: int) -> bool:
+    """True once the job has completed; raises if it failed or ``timeout`` has run out."""
+    status = job_info["status"]
+    if status == "completed":
+        return True
+    if status in TERMINAL_STATUSES:
+        _raise_job_failure(job_id, job_info)
+    if time.time() - start > timeout:
+        raise TimeoutError(f"Job {job_id} timed out after {timeout}s")
+    return False
+
+
+def _retry_delay(attempt: int) -> float:
+    """Pause before retrying a request, matching the backoff of the session's urllib3 Retry."""
+    return 0.3 * 2 ** attempt
+
+
+def _retry_after(status_code: int, headers) -> Optional[float]:
+    """Seconds the server asked us to wait in a ``Retry-After`` header, as urllib3 honours it."""
+    value = headers.get("Retry-After")
+    if status_code not in (429, 503) or value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _as_requests_response(resp: httpx.Response) -> requests.Response:
+    # Status polls go over httpx; hand them back as requests responses so raise_for_status()
+    # and json() behave (and fail) the same as for every other call of the client
+    out = requests.Response()
+    out.status_code = resp.status_code
+    out.reason = resp.reason_phrase
+    out.headers = requests.structures.CaseInsensitiveDict(resp.headers)
+    out.url = str(resp.url)
+    out.encoding = resp.encoding
+    out._content = resp.content
+    return out
+
+
+def _output_path(output_dir: str, input_base_name: str, metadata: dict, asset: dict) -> str:
+    # Named after the input file and the model (from metadata, or a default), with the
+    # format extension of the asset name (wav if it has none)
+    model_name = metadata.get("name", "output")
+    format_ext = _asset_ext(asset.get("name", "output.wav"))
+    return os.path.join(output_dir, f"{input_base_name}_{model_name}.{format_ext}")
+
+
+def _with_output_paths(job_info: dict, output_paths: List[str]) -> dict:
+    # Add output path information to a copy of the job info
+    job_info = dict(job_info)
+    if len(output_paths) == 1:
+        job_info["output_path"] = output_paths[0]
+    else:
+        job_info["output_paths"] = output_paths
+    return job_info
+
+
+class _PollBackoff:
+    """Client-side delay between status polls.
+
+    The delay grows by ``factor`` up to ``maximum`` (plus up to 25% jitter, so many waiters
+    don't poll in lockstep) and restarts from ``initial`` whenever the job changes status.
+    """
+
+    def __init__(self, initial: float, maximum: float, factor: float):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.delay = initial
+        self._last_status = None
+
+    def observe(self, status: str) -> None:
+        if self._last_status is not None and status != self._last_status:
+            self.reset()
+        self._last_status = status
+
+    def reset(self) -> None:
+        self.delay = self.initial
+
+    def next_pause(self) -> float:
+        pause = min(self.delay, self.maximum) + random.uniform(0, 0.25 * self.delay)
+        self.delay = min(self.delay * self.factor, self.maximum)
+        return pause
+
+
+class _MultipartFileBody:
+    """Streaming ``multipart/form-data`` body holding a single file field.
+
+    The file (a path, or a seekable binary file object such as a ``BytesIO``) is read as the
+    request is sent instead of being encoded in memory first. The body is seekable so
+    urllib3 can rewind it when the session retries a POST. File objects are read from
+    their current position and left open.
+    """
+
+    def __init__(self, field: str, source: Union[str, BinaryIO], filename: str = None, content_type: str = None):
+        boundary = uuid.uuid4().hex
+        if filename is None:
+            filename = os.path.basename(source)
+        filename = filename.replace('"', "%22")
+        content_type = content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        if isinstance(source, str):
+            self._file = open(source, "rb")
+            self._owns_file = True
+        else:
+            self._file = source
+            self._owns_file = False
+        self._name = filename
+        self._offset = self._file.tell()
+        self._size = self._file.seek(0, os.SEEK_END) - self._offset
+        self._file.seek(self._offset)
+        self._len = len(self._head) + self._size + len(self._tail)
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self._owns_file:
+            self._file.close()
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._len - self._pos
+        file_end = len(self._head) + self._size
+        parts = []
+        while size > 0 and self._pos < self._len:
+            if self._pos < len(self._head):
+                chunk = self._head[self._pos:self._pos + size]
+            elif self._pos < file_end:
+                chunk = self._file.read(min(size, file_end - self._pos))
+                if not chunk:
+                    raise IOError(f"{self._name} shrank while it was being uploaded")
+            else:
+                offset = self._pos - file_end
+                chunk = self._tail[offset:offset + size]
+            self._pos += len(chunk)
+            size -= len(chunk)
+            parts.append(chunk)
+        return b"".join(parts)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._pos, os.SEEK_END: self._len}[whence]
+        self._pos = base + offset
+        self._file.seek(self._offset + min(max(self._pos - len(self._head), 0), self._size))
+        return self._pos
+
 
 class AudioShakeClient:
     def __init__(self, token: str, base_url: str = "https://groovy.audioshake.ai"):
         self.token = token
         self.base_url = base_url
+        self._job_url = f"{self.base_url}/job/"
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/json"
         }
 
+        # One pooled session shared by every helper (and every worker thread in
+        # process_jobs) so polls, uploads and downloads reuse keep-alive connections.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=list(RETRY_STATUSES),
+            allowed_methods=["GET", "POST"],
+            raise_on_status=False,  # hand the final response back so callers see the real status
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Status polls are many small concurrent requests to one host, so they are multiplexed
+        # over a single HTTP/2 connection shared by all threads. Bulk uploads and downloads
+        # stay on the requests session above.
+        self._poll_client = httpx.Client(http2=True, headers=self.headers, timeout=30.0)
+
+    def close(self) -> None:
+        self.session.close()
+        self._poll_client.close()
+
     def validate_connection(self) -> bool:
         """Validate that the API token is valid and the service is accessible."""
         try:
             # Try to access a simple endpoint to validate the token
-            url = f"{self.base_url}/job/"
-            resp = requests.get(url, headers=self.headers, timeout=10)
+            resp = self.session.get(self._job_url, timeout=10)
             if resp.status_code == 401:
                 raise RuntimeError("Invalid API token - authentication failed")
             elif resp.status_code == 403:
@@ -43,18 +283,22 @@ class AudioShakeClient:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         file_size = os.path.getsize(file_path)
-        print(f"📁 File size: {file_size / (1024*1024):.2f} MB")
+        logger.info("📁 File size: %.2f MB", file_size / (1024*1024))
         
         # Check if file is too large (AudioShake might have limits)
         if file_size > 500 * 1024 * 1024:  # 500MB limit
-            print("⚠️  Warning: File is larger than 500MB, which might cause issues")
+            logger.warning("⚠️  Warning: File is larger than 500MB, which might cause issues")
         
         url = f"{self.base_url}/upload/"
         try:
-            with open(file_path, "rb") as f:
-                files = {"file": f}
-                print(f"📤 Uploading to: {url}")
-                resp = requests.post(url, headers=self.headers, files=files, timeout=300)  # 5 minute timeout
+            with _MultipartFileBody("file", file_path) as body:
+                logger.info("📤 Uploading to: %s", url)
+                resp = self.session.post(
+                    url,
+                    data=body,
+                    headers={"Content-Type": body.content_type},
+                    timeout=300  # 5 minute timeout
+                )
             resp.raise_for_status()
             return resp.json()
         except requests.exceptions.Timeout:
@@ -64,31 +308,252 @@ class AudioShakeClient:
         except Exception as e:
             raise RuntimeError(f"Unexpected error during upload: {str(e)}")
 
+    def upload_bytes(self, buf: Union[bytes, BinaryIO], filename: str) -> dict:
+        """Upload an in-memory WAV (bytes or a seekable file-like object) without touching the disk.
+
+        The buffer is streamed into the request rather than copied into an encoded body.
+        """
+        if isinstance(buf, (bytes, bytearray)):
+            buf = io.BytesIO(buf)
+        url = f"{self.base_url}/upload/"
+        try:
+            with _MultipartFileBody("file", buf, filename, "audio/wav") as body:
+                resp = self.session.post(
+                    url,
+                    data=body,
+                    headers={"Content-Type": body.content_type},
+                    timeout=300  # 5 minute timeout
+                )
+            resp.raise_for_status()
+            return resp.json()
+        except requests.exceptions.Timeout:
+            raise RuntimeError(f"Upload timed out for buffer: {filename}")
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"Upload failed for buffer {filename}: {str(e)}")
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error during upload: {str(e)}")
+
     def create_job(self, asset_id: str, metadata: dict, callback_url: str = None) -> dict:
-        url = f"{self.base_url}/job/"
+        url = self._job_url
         payload = {"assetId": asset_id, "metadata": metadata}
         if callback_url:
             payload["callbackUrl"] = callback_url
-        resp = requests.post(
+        resp = self.session.post(
             url,
-            headers={**self.headers, "Content-Type": "application/json"},
+            headers={"Content-Type": "application/json"},
             json=payload
         )
         resp.raise_for_status()
         return resp.json()["job"]
 
-    def get_job(self, job_id: str) -> dict:
-        url = f"{self.base_url}/job/{job_id}"
-        resp = requests.get(url, headers=self.headers)
+    def get_job(self, job_id: str, wait: int = 0) -> dict:
+        """Fetch a job's status.
+
+        Polls travel over the HTTP/2 poll client rather than the requests session, but fail
+        like every other call: HTTP errors raise ``requests.HTTPError`` and network errors
+        ``requests.ConnectionError`` or ``requests.Timeout`` (a long-poll that the server
+        held for the whole window raises ``requests.exceptions.ReadTimeout``).
+        """
+        url = self._job_url + job_id
+        if wait:
+            # Ask the server to hold the request open until the job changes (long-poll)
+            resp = self._poll_get(url, params={"wait": wait}, timeout=wait + 5)
+        else:
+            resp = self._poll_get(url)
         resp.raise_for_status()
         return resp.json()
 
+    def _poll_get(self, url: str, **kwargs) -> requests.Response:
+        # GET on the HTTP/2 poll client, retrying dropped connections and transient statuses
+        # the same way the session's adapter does (Retry-After included). Timeouts are not
+        # retried: for long-polls they just mean nothing changed. httpx errors are raised as
+        # their requests counterparts.
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                resp = self._poll_client.get(url, **kwargs)
+            except httpx.ConnectTimeout as e:
+                raise requests.exceptions.ConnectTimeout(str(e)) from e
+            except httpx.ReadTimeout as e:
+                raise requests.exceptions.ReadTimeout(str(e)) from e
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(str(e)) from e
+            except httpx.TransportError as e:
+                if attempt == MAX_RETRIES:
+                    raise requests.exceptions.ConnectionError(str(e)) from e
+                time.sleep(_retry_delay(attempt))
+                continue
+            if resp.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return _as_requests_response(resp)
+            delay = _retry_after(resp.status_code, resp.headers)
+            time.sleep(_retry_delay(attempt) if delay is None else delay)
+
     def download_asset(self, link: str, destination_path: str) -> None:
-        resp = requests.get(link, stream=True)
+        # Asset links are pre-signed, so don't send our bearer token along with them.
+        # The first request only asks for the first part; it doubles as the range-support probe.
+        headers = {"Authorization": None, "Range": f"bytes=0-{DOWNLOAD_PART_SIZE - 1}"}
+        resp = self.session.get(link, headers=headers, stream=True)
+        with resp:
+            if resp.status_code == 416 and resp.headers.get("Content-Range", "").strip() == "bytes */0":
+                # An empty asset has no first byte to ask for
+                open(destination_path, "wb").close()
+                return
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            with open(destination_path, "wb") as f:
+                total = resp.headers.get("Content-Range", "").rpartition("/")[2]
+                if resp.status_code != 206 or not total.isdigit():
+                    # No range support: this is the whole body, stream it as-is
+                    shutil.copyfileobj(resp.raw, f, length=COPY_BUFFER_SIZE)
+                    return
+                total = int(total)
+                f.truncate(total)
+                shutil.copyfileobj(resp.raw, f, length=COPY_BUFFER_SIZE)
+
+        if total <= DOWNLOAD_PART_SIZE:
+            return
+
+        # Fetch the rest concurrently, each range written into its own slot of the file
+        remaining = total - DOWNLOAD_PART_SIZE
+        part_size = max(DOWNLOAD_PART_SIZE, -(-remaining // DOWNLOAD_WORKERS))
+        ranges = [
+            (start, min(start + part_size, total) - 1)
+            for start in range(DOWNLOAD_PART_SIZE, total, part_size)
+        ]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [
+                pool.submit(self._download_range, link, destination_path, start, end)
+                for start, end in ranges
+            ]
+            for f in futures:
+                f.result()
+
+    def fetch_asset(self, link: str) -> bytes:
+        # Asset links are pre-signed, so don't send our bearer token along with them
+        resp = self.session.get(link, headers={"Authorization": None})
         resp.raise_for_status()
-        with open(destination_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
+        return resp.content
+
+    def _fetch_small_json(self, link: str):
+        # Parse a JSON asset straight from the response, or return None if it is too large
+        # (or of unknown size) and should be downloaded to disk instead
+        resp = self.session.get(link, headers={"Authorization": None}, stream=True)
+        with resp:
+            resp.raise_for_status()
+            size = resp.headers.get("Content-Length")
+            if size is None or int(size) >= INLINE_JSON_MAX_SIZE:
+                return None
+            return resp.json()
+
+    def _download_range(self, link: str, destination_path: str, start: int, end: int) -> None:
+        headers = {"Authorization": None, "Range": f"bytes={start}-{end}"}
+        resp = self.session.get(link, headers=headers, stream=True)
+        with resp:
+            resp.raise_for_status()
+            if resp.status_code != 206:
+                raise RuntimeError(f"Server ignored range request {start}-{end} for {link}")
+            resp.raw.decode_content = True
+            with open(destination_path, "r+b") as f:
+                f.seek(start)
+                shutil.copyfileobj(resp.raw, f, length=COPY_BUFFER_SIZE)
+                written = f.tell() - start
+        if written != end - start + 1:
+            raise RuntimeError(f"Incomplete download of bytes {start}-{end}: got {written} bytes")
+
+    # ---------- Polling ----------
+
+    def _wait_for_completion(
+        self,
+        job_id: str,
+        start: float,
+        timeout: int,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.7,
+        long_poll: int = 25,
+        cancel: threading.Event = None
+    ) -> dict:
+        """Poll a job until it completes, backing off exponentially (with jitter) between polls.
+
+        Each poll asks the server to hold the request for up to ``long_poll`` seconds. If the
+        server answers straight away (no long-poll support) we fall back to sleeping client-side;
+        the delay resets to ``initial_interval`` whenever the job changes status, so short
+        jobs are picked up quickly while long-running ones are polled less and less often.
+        Setting ``cancel`` stops the wait after the poll in flight, with a RuntimeError.
+        Returns the completed job info; raises on failure or timeout.
+        """
+        backoff = _PollBackoff(initial_interval, max_interval, backoff_factor)
+
+        while True:
+            _check_cancelled(job_id, cancel)
+            poll_start = time.monotonic()
+            try:
+                job_info = self.get_job(job_id, wait=long_poll)["job"]
+            except requests.exceptions.ReadTimeout:
+                # The server held the request for the whole window: nothing changed yet
+                if time.time() - start > timeout:
+                    raise TimeoutError(f"Job {job_id} timed out after {timeout}s")
+                continue
+            held = time.monotonic() - poll_start >= 1.0
+            status = job_info["status"]
+            logger.debug("📊 Job %s status: %s", job_id, status)
+
+            if _job_finished(job_id, job_info, start, timeout):
+                return job_info
+            backoff.observe(status)
+
+            if held:
+                # The server already waited for us, poll again straight away
+                continue
+            pause = backoff.next_pause()
+            if cancel is not None:
+                cancel.wait(pause)
+            else:
+                time.sleep(pause)
+
+    def _poll_many(
+        self,
+        job_ids: List[str],
+        start: float,
+        timeout: int,
+        results: Dict[str, object],
+        events: Dict[str, threading.Event],
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.7
+    ) -> None:
+        """Poll several jobs from a single loop until every one of them is terminal.
+
+        Each round issues one status read per pending job over the shared keep-alive
+        session. As a job finishes, its final job info (or the exception it failed with) is
+        stored in ``results`` and its event in ``events`` is set.
+        """
+        pending = list(job_ids)
+        last_status = {}
+        backoff = _PollBackoff(initial_interval, max_interval, backoff_factor)
+
+        while pending:
+            changed = False
+            for job_id in list(pending):
+                try:
+                    job_info = self.get_job(job_id)["job"]
+                    status = job_info["status"]
+                    logger.debug("📊 Job %s status: %s", job_id, status)
+                    if _job_finished(job_id, job_info, start, timeout):
+                        results[job_id] = job_info
+                    else:
+                        changed |= last_status.get(job_id, status) != status
+                        last_status[job_id] = status
+                        continue
+                except Exception as e:
+                    results[job_id] = e
+                pending.remove(job_id)
+                events[job_id].set()
+
+            if not pending:
+                return
+            if changed:
+                backoff.reset()
+            time.sleep(backoff.next_pause())
 
     # ---------- One-off job ----------
 
@@ -97,67 +562,81 @@ class AudioShakeClient:
         file_path: str,
         metadata: dict,
         callback_url: str = None,
-        poll_interval: int = 5,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.7,
         timeout: int = 3600,
-        output_dir: str = "."
+        output_dir: str = ".",
+        inline_json: bool = False
     ) -> dict:
-        print(f"📤 Uploading file: {file_path}")
+        """Upload *file_path*, run one job on it and download its outputs into *output_dir*.
+
+        With ``inline_json``, small JSON outputs are parsed straight from the response and
+        returned under ``output_data`` instead of being written to disk.
+        """
+        logger.info("📤 Uploading file: %s", file_path)
         asset = self.upload_file(file_path)
-        print(f"✅ File uploaded successfully. Asset ID: {asset['id']}")
-        
-        print(f"🚀 Creating job with metadata: {metadata}")
-        job = self.create_job(asset["id"], metadata, callback_url)
-        job_id = job["id"]
-        print(f"✅ Job created successfully. Job ID: {job_id}")
-        
-        start = time.time()
+        logger.info("✅ File uploaded successfully. Asset ID: %s", asset["id"])
 
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
-        
-        # Get base name of input file
-        input_base_name = Path(file_path).stem
-        output_paths = []
 
-        while True:
-            job_info = self.get_job(job_id)["job"]
-            status = job_info["status"]
-            print(f"📊 Job {job_id} status: {status}")
-
-            if status == "completed":
-                print(f"✅ Job {job_id} completed successfully!")
-                for a in job_info.get("outputAssets", []):
-                    if a.get("link"):
-                        # Get model name from metadata or use default
-                        model_name = metadata.get("name", "output")
-                        # Get format extension from asset name or default to wav
-                        format_ext = Path(a.get("name", "output.wav")).suffix[1:] or "wav"
-                        # Construct output filename
-                        output_filename = f"{input_base_name}_{model_name}.{format_ext}"
-                        output_path = os.path.join(output_dir, output_filename)
-                        print(f"📥 Downloading output to: {output_path}")
-                        self.download_asset(a["link"], output_path)
-                        output_paths.append(output_path)
-                # Add output path information to the return value
-                if len(output_paths) == 1:
-                    job_info["output_path"] = output_paths[0]
-                else:
-                    job_info["output_paths"] = output_paths
-                return job_info
+        return self._process_single_job_no_upload(
+            asset["id"],
+            metadata,
+            callback_url,
+            initial_interval,
+            max_interval,
+            backoff_factor,
+            timeout,
+            output_dir,
+            Path(file_path).stem,
+            inline_json
+        )
+
+    def process_job_from_buffer(
+        self,
+        buf: Union[bytes, BinaryIO],
+        filename: str,
+        metadata: dict,
+        callback_url: str = None,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.7,
+        timeout: int = 3600,
+        output_dir: str = ".",
+        inline_json: bool = False,
+        in_memory: bool = False,
+        cancel: threading.Event = None
+    ) -> dict:
+        """Same as :meth:`process_job`, but uploads an in-memory WAV instead of a file on disk.
 
-            if status in ("failed", "error"):
-                # Get more detailed error information
-                error_details = job_info.get("error", "No error details available")
-                error_message = job_info.get("errorMessage", "No error message available")
-                print(f"❌ Job {job_id} failed with status: {status}")
-                print(f"❌ Error details: {error_details}")
-                print(f"❌ Error message: {error_message}")
-                raise RuntimeError(f"Job {job_id} failed: {status}. Details: {error_details}. Message: {error_message}")
+        Outputs are named after *filename*, so give concurrent jobs distinct names. With
+        ``in_memory``, outputs are not written to disk at all; their bodies are returned as a
+        list of bytes under ``output_bytes``. Setting ``cancel`` abandons the job while it is
+        being waited on.
+        """
+        logger.info("📤 Uploading buffer: %s", filename)
+        asset = self.upload_bytes(buf, filename)
+        logger.info("✅ Buffer uploaded successfully. Asset ID: %s", asset["id"])
 
-            if time.time() - start > timeout:
-                raise TimeoutError(f"Job {job_id} timed out after {timeout}s")
+        # Create output directory if it doesn't exist
+        os.makedirs(output_dir, exist_ok=True)
 
-            time.sleep(poll_interval)
+        return self._process_single_job_no_upload(
+            asset["id"],
+            metadata,
+            callback_url,
+            initial_interval,
+            max_interval,
+            backoff_factor,
+            timeout,
+            output_dir,
+            Path(filename).stem,
+            inline_json=inline_json,
+            in_memory=in_memory,
+            cancel=cancel
+        )
 
     # ---------- Multi-stem workflow (no post-processing) ----------
 
@@ -166,53 +645,69 @@ class AudioShakeClient:
         asset_id: str,
         metadata: dict,
         callback_url: str,
-        poll_interval: int,
+        initial_interval: float,
+        max_interval: float,
+        backoff_factor: float,
         timeout: int,
         output_dir: str,
-        input_base_name: str
+        input_base_name: str,
+        inline_json: bool = False,
+        in_memory: bool = False,
+        cancel: threading.Event = None
     ) -> dict:
+        logger.info("🚀 Creating job with metadata: %s", metadata)
         job = self.create_job(asset_id, metadata, callback_url)
         job_id = job["id"]
+        logger.info("✅ Job created successfully. Job ID: %s", job_id)
         start = time.time()
-        output_paths = []
-
-        while True:
-            job_info = self.get_job(job_id)["job"]
-            status = job_info["status"]
-
-            if status == "completed":
-                for a in job_info.get("outputAssets", []):
-                    if a.get("link"):
-                        # Get model name from metadata or use default
-                        model_name = metadata.get("name", "output")
-                        # Get format extension from asset name or default to wav
-                        format_ext = Path(a.get("name", "output.wav")).suffix[1:] or "wav"
-                        # Construct output filename
-                        output_filename = f"{input_base_name}_{model_name}.{format_ext}"
-                        output_path = os.path.join(output_dir, output_filename)
-                        self.download_asset(a["link"], output_path)
-                        output_paths.append(output_path)
-                # Add output path information to the return value
-                if len(output_paths) == 1:
-                    job_info["output_path"] = output_paths[0]
-                else:
-                    job_info["output_paths"] = output_paths
-                return job_info
 
-            if status in ("failed", "error"):
-                raise RuntimeError(f"Job {job_id} failed: {status}")
+        job_info = self._wait_for_completion(
+            job_id, start, timeout,
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+            cancel=cancel,
+        )
+        logger.info("✅ Job %s completed successfully!", job_id)
+        return self._download_outputs(job_info, metadata, output_dir, input_base_name, inline_json, in_memory)
 
-            if time.time() - start > timeout:
-                raise TimeoutError(f"Job {job_id} timed out after {timeout}s")
+    def _download_outputs(
+        self,
+        job_info: dict,
+        metadata: dict,
+        output_dir: str,
+        input_base_name: str,
+        inline_json: bool = False,
+        in_memory: bool = False
+    ) -> dict:
+        if in_memory:
+            job_info["output_bytes"] = [
+                self.fetch_asset(a["link"]) for a in job_info.get("outputAssets", []) if a.get("link")
+            ]
+            return job_info
 
-            time.sleep(poll_interval)
+        output_paths = []
+        for a in job_info.get("outputAssets", []):
+            if a.get("link"):
+                if inline_json and _asset_ext(a.get("name", "output.wav")) == "json":
+                    data = self._fetch_small_json(a["link"])
+                    if data is not None:
+                        job_info["output_data"] = data
+                        continue
+                output_path = _output_path(output_dir, input_base_name, metadata, a)
+                logger.info("📥 Downloading output to: %s", output_path)
+                self.download_asset(a["link"], output_path)
+                output_paths.append(output_path)
+        return _with_output_paths(job_info, output_paths)
 
     def process_jobs(
         self,
         file_path: str,
         metadata_list: List[Dict],
         callback_url: str = None,
-        poll_interval: int = 5,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.7,
         timeout: int = 3600,
         output_dir: str = "."
     ) -> List[Dict]:
@@ -222,22 +717,40 @@ class AudioShakeClient:
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
 
+        jobs = []
+        for meta in metadata_list:
+            logger.info("🚀 Creating job with metadata: %s", meta)
+            jobs.append((self.create_job(asset_id, meta, callback_url)["id"], meta))
+        start = time.time()
+
+        # One coordinator thread polls every job; workers only wait for their own job to
+        # finish and then download its outputs
+        job_ids = [job_id for job_id, _ in jobs]
+        finished: Dict[str, object] = {}
+        events = {job_id: threading.Event() for job_id in job_ids}
+        poller = threading.Thread(
+            target=self._poll_many,
+            args=(job_ids, start, timeout, finished, events),
+            kwargs={
+                "initial_interval": initial_interval,
+                "max_interval": max_interval,
+                "backoff_factor": backoff_factor,
+            },
+            daemon=True,
+        )
+        poller.start()
+
+        def _finish(job_id: str, meta: dict) -> dict:
+            events[job_id].wait()
+            outcome = finished[job_id]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return self._download_outputs(outcome, meta, output_dir, input_base_name)
+
         results = []
         with concurrent.futures.ThreadPoolExecutor() as pool:
-            futures = [
-                pool.submit(
-                    self._process_single_job_no_upload,
-                    asset_id,
-                    meta,
-                    callback_url,
-                    poll_interval,
-                    timeout,
-                    output_dir,
-                    input_base_name
-                )
-                for meta in metadata_list
-            ]
+            futures = [pool.submit(_finish, job_id, meta) for job_id, meta in jobs]
             for f in concurrent.futures.as_completed(futures):
                 results.append(f.result())
 
-        return results
\ No newline at end of file
+        return results
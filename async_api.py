@@ -0,0 +1,279 @@
+"""Asyncio flavour of :class:`api.AudioShakeClient`, built on ``httpx`` with HTTP/2.
+
+Every concurrent poll, upload and download runs on a single event loop and shares one
+multiplexed connection, so fanning out over many jobs needs neither threads nor extra
+TLS handshakes.
+
+Requests are retried on dropped connections and on ``RETRY_STATUSES`` with the same
+budget and backoff as the sync client, and polling, output naming and failure handling
+share its helpers. File I/O is pushed to worker threads so it never blocks the loop.
+It deliberately covers less ground than :class:`api.AudioShakeClient`:
+
+* no single poll coordinator: each job is its own long-poll coroutine,
+  which costs nothing extra on one multiplexed connection;
+* downloads are a single streamed GET, not ranged parallel parts;
+* no ``inline_json``, ``in_memory`` or buffer uploads (``upload_bytes``), so
+  ``smart_mute`` keeps using the sync client;
+* errors are raised as ``httpx`` exceptions, not translated to ``requests`` ones.
+"""
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import AsyncIterator, List, Dict
+
+import httpx
+
+from api import (
+    COPY_BUFFER_SIZE,
+    MAX_RETRIES,
+    RETRY_STATUSES,
+    _MultipartFileBody,
+    _PollBackoff,
+    _job_finished,
+    _output_path,
+    _retry_after,
+    _retry_delay,
+    _with_output_paths,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAudioShakeClient:
+    def __init__(self, token: str, base_url: str = "https://groovy.audioshake.ai"):
+        self.token = token
+        self.base_url = base_url
+        self._job_url = f"{self.base_url}/job/"
+        self.headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/json"
+        }
+        # Auth headers are passed per API call rather than set on the client, because
+        # asset links are pre-signed and must not carry our bearer token
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=50),
+            timeout=60.0,
+        )
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def _send(self, method: str, url: str, body: _MultipartFileBody = None, stream: bool = False, **kwargs) -> httpx.Response:
+        # Retry dropped connections and transient statuses like the sync client does,
+        # honouring Retry-After.
+        # Timeouts are not retried: for long-polls they just mean nothing changed. An
+        # upload body is rewound and streamed afresh on every attempt.
+        for attempt in range(MAX_RETRIES + 1):
+            if body is not None:
+                await asyncio.to_thread(body.seek, 0)
+                kwargs["content"] = self._stream_body(body)
+            try:
+                resp = await self.client.send(self.client.build_request(method, url, **kwargs), stream=stream)
+                if resp.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return resp
+                await resp.aclose()
+            except httpx.TimeoutException:
+                raise
+            except httpx.TransportError:
+                if attempt == MAX_RETRIES:
+                    raise
+                await asyncio.sleep(_retry_delay(attempt))
+                continue
+            delay = _retry_after(resp.status_code, resp.headers)
+            await asyncio.sleep(_retry_delay(attempt) if delay is None else delay)
+
+    @staticmethod
+    async def _stream_body(body: _MultipartFileBody) -> AsyncIterator[bytes]:
+        while True:
+            chunk = await asyncio.to_thread(body.read, COPY_BUFFER_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    # ---------- Core API helpers ----------
+
+    async def upload_file(self, file_path: str) -> dict:
+        # Validate file exists and is readable
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        file_size = os.path.getsize(file_path)
+        logger.info("📁 File size: %.2f MB", file_size / (1024*1024))
+
+        url = f"{self.base_url}/upload/"
+        try:
+            with await asyncio.to_thread(_MultipartFileBody, "file", file_path) as body:
+                logger.info("📤 Uploading to: %s", url)
+                resp = await self._send(
+                    "POST",
+                    url,
+                    body=body,
+                    headers={
+                        **self.headers,
+                        "Content-Type": body.content_type,
+                        "Content-Length": str(len(body)),
+                    },
+                    timeout=300  # 5 minute timeout
+                )
+            resp.raise_for_status()
+            return resp.json()
+        except httpx.TimeoutException:
+            raise RuntimeError(f"Upload timed out for file: {file_path}")
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"Upload failed for file {file_path}: {str(e)}")
+
+    async def create_job(self, asset_id: str, metadata: dict, callback_url: str = None) -> dict:
+        payload = {"assetId": asset_id, "metadata": metadata}
+        if callback_url:
+            payload["callbackUrl"] = callback_url
+        resp = await self._send("POST", self._job_url, headers=self.headers, json=payload)
+        resp.raise_for_status()
+        return resp.json()["job"]
+
+    async def get_job(self, job_id: str, wait: int = 0) -> dict:
+        url = self._job_url + job_id
+        if wait:
+            # Ask the server to hold the request open until the job changes (long-poll)
+            resp = await self._send("GET", url, headers=self.headers, params={"wait": wait}, timeout=wait + 5)
+        else:
+            resp = await self._send("GET", url, headers=self.headers)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def download_asset(self, link: str, destination_path: str) -> None:
+        resp = await self._send("GET", link, stream=True)
+        try:
+            resp.raise_for_status()
+            f = await asyncio.to_thread(open, destination_path, "wb")
+            try:
+                async for chunk in resp.aiter_bytes(chunk_size=COPY_BUFFER_SIZE):
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+        finally:
+            await resp.aclose()
+
+    # ---------- Polling ----------
+
+    async def _wait_for_completion(
+        self,
+        job_id: str,
+        start: float,
+        timeout: int,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.7,
+        long_poll: int = 25
+    ) -> dict:
+        """Async counterpart of :meth:`api.AudioShakeClient._wait_for_completion`."""
+        backoff = _PollBackoff(initial_interval, max_interval, backoff_factor)
+
+        while True:
+            poll_start = time.monotonic()
+            try:
+                job_info = (await self.get_job(job_id, wait=long_poll))["job"]
+            except httpx.ReadTimeout:
+                # The server held the request for the whole window: nothing changed yet
+                if time.time() - start > timeout:
+                    raise TimeoutError(f"Job {job_id} timed out after {timeout}s")
+                continue
+            held = time.monotonic() - poll_start >= 1.0
+            status = job_info["status"]
+            logger.debug("📊 Job %s status: %s", job_id, status)
+
+            if _job_finished(job_id, job_info, start, timeout):
+                return job_info
+            backoff.observe(status)
+
+            if held:
+                # The server already waited for us, poll again straight away
+                continue
+            await asyncio.sleep(backoff.next_pause())
+
+    # ---------- Jobs ----------
+
+    async def _run_job(
+        self,
+        asset_id: str,
+        metadata: dict,
+        callback_url: str,
+        initial_interval: float,
+        max_interval: float,
+        backoff_factor: float,
+        timeout: int,
+        output_dir: str,
+        input_base_name: str
+    ) -> dict:
+        logger.info("🚀 Creating job with metadata: %s", metadata)
+        job_id = (await self.create_job(asset_id, metadata, callback_url))["id"]
+        logger.info("✅ Job created successfully. Job ID: %s", job_id)
+
+        job_info = await self._wait_for_completion(
+            job_id, time.time(), timeout,
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+        )
+        logger.info("✅ Job %s completed successfully!", job_id)
+
+        output_paths = []
+        for a in job_info.get("outputAssets", []):
+            if a.get("link"):
+                output_path = _output_path(output_dir, input_base_name, metadata, a)
+                logger.info("📥 Downloading output to: %s", output_path)
+                await self.download_asset(a["link"], output_path)
+                output_paths.append(output_path)
+        return _with_output_paths(job_info, output_paths)
+
+    async def process_job(
+        self,
+        file_path: str,
+        metadata: dict,
+        callback_url: str = None,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.7,
+        timeout: int = 3600,
+        output_dir: str = "."
+    ) -> dict:
+        logger.info("📤 Uploading file: %s", file_path)
+        asset_id = (await self.upload_file(file_path))["id"]
+        await asyncio.to_thread(os.makedirs, output_dir, exist_ok=True)
+        return await self._run_job(
+            asset_id, metadata, callback_url,
+            initial_interval, max_interval, backoff_factor, timeout,
+            output_dir, Path(file_path).stem
+        )
+
+    async def process_jobs(
+        self,
+        file_path: str,
+        metadata_list: List[Dict],
+        callback_url: str = None,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.7,
+        timeout: int = 3600,
+        output_dir: str = "."
+    ) -> List[Dict]:
+        asset_id = (await self.upload_file(file_path))["id"]
+        input_base_name = Path(file_path).stem
+        await asyncio.to_thread(os.makedirs, output_dir, exist_ok=True)
+
+        return await asyncio.gather(*[
+            self._run_job(
+                asset_id, meta, callback_url,
+                initial_interval, max_interval, backoff_factor, timeout,
+                output_dir, input_base_name
+            )
+            for meta in metadata_list
+        ])
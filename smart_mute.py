@@ -1,5 +1,9 @@
+import contextlib
+import hashlib
+import io
 import json
 import os
+import logging
 import soundfile as sf
 import numpy as np
 from api import AudioShakeClient
@@ -10,10 +14,63 @@ import sys
 import traceback
 import tempfile
 import subprocess
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from typing import BinaryIO, Collection, Iterable, Iterator, Union
 
-def _convert_to_wav(input_path: str, temp_dir: str) -> str:
+try:
+    # Optional: decodes MP3/M4A/MP4/MOV in-process instead of spawning ffmpeg
+    import av
+except ImportError:
+    av = None
+
+# Input formats smart_mute accepts (anything but WAV is converted with PyAV or ffmpeg first)
+SUPPORTED_EXTS = {'.wav', '.mp3', '.m4a', '.mp4', '.mov'}
+# Upper bound on concurrent music-removal jobs per file, to respect API rate limits
+MAX_SEGMENT_WORKERS = 8
+# Frames copied per block when streaming untouched audio to the output
+BLOCK_SIZE = 1 << 20
+# ffmpeg output kept in memory up to this size (~6 min of 44.1kHz stereo); longer audio spills to disk
+IN_MEMORY_WAV_MAX = 64 * 1024 * 1024
+# Most bytes taken from the ffmpeg pipe per read
+PIPE_READ_SIZE = 1 << 20
+# Python-side write buffer for the output file
+WRITE_BUFFER_SIZE = 1 << 20
+# Music events separated by less than this many seconds are processed as one segment
+MERGE_GAP_SECONDS = 0.2
+# Detection results and per-segment removal outputs from earlier runs
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "smart_mute")
+# Read size used when hashing the input to key the cache
+FINGERPRINT_CHUNK = 1 << 20
+
+def _file_fingerprint(file_path: str) -> str:
+    """Content key for *file_path*: a hash of the whole file, so any edit gives a new key."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(FINGERPRINT_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _write_cache(cache_path: str, data: bytes) -> None:
+    """Store *data* at *cache_path* atomically; a cache that can't be written is only a warning."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(cache_path), suffix=".tmp", delete=False) as f:
+            f.write(data)
+        os.replace(f.name, cache_path)
+    except OSError as e:
+        print(f"    ⚠️  Could not write cache entry {cache_path}: {e}")
+
+class _ConversionCancelled(Exception):
+    """Raised inside a conversion once its cancel event is set."""
+
+def _check_cancelled(cancel: threading.Event) -> None:
+    if cancel is not None and cancel.is_set():
+        raise _ConversionCancelled("conversion cancelled")
+
+def _convert_to_wav(input_path: str, temp_dir: str, cancel: threading.Event = None) -> Union[str, io.BytesIO]:
     """
-    Convert audio/video file to WAV format temporarily using ffmpeg.
+    Convert audio/video file to WAV format temporarily, in-process where possible and with ffmpeg otherwise.
     
     Parameters
     ----------
@@ -21,47 +78,105 @@ def _convert_to_wav(input_path: str, temp_dir: str) -> str:
         Path to the input file
     temp_dir : str
         Temporary directory to store the converted WAV file
+    cancel : threading.Event, optional
+        Set by the caller to abandon the conversion; ffmpeg is killed and decoding stops
+        with ``_ConversionCancelled``.
         
     Returns
     -------
-    str
-        Path to the temporary WAV file
+    str or io.BytesIO
+        Path to the WAV file, or the WAV itself when ffmpeg's output was kept in memory
     """
     input_path = Path(input_path)
-    supported_formats = {'.wav', '.mp3', '.m4a', '.mp4', '.mov'}
-    
-    if input_path.suffix.lower() not in supported_formats:
-        raise ValueError(f"Unsupported file format: {input_path.suffix}. Supported formats: {', '.join(supported_formats)}")
+
+    if input_path.suffix.lower() not in SUPPORTED_EXTS:
+        raise ValueError(f"Unsupported file format: {input_path.suffix}. Supported formats: {', '.join(SUPPORTED_EXTS)}")
     
-    # If already WAV, just return the original path
+    # If already a WAV libsndfile can decode, use it as-is: the rest of the pipeline handles any
+    # sample rate, channel count and PCM width, so there is nothing for ffmpeg to do
     if input_path.suffix.lower() == '.wav':
-        print(f"    ✅ File is already WAV format: {input_path}")
-        return str(input_path)
+        try:
+            info = sf.info(str(input_path))
+        except RuntimeError:
+            print(f"    ⚠️  WAV file is not readable by libsndfile, converting it with ffmpeg")
+        else:
+            print(f"    ✅ File is already WAV format ({info.samplerate}Hz, {info.channels}ch, {info.subtype}): {input_path}")
+            return str(input_path)
     
-    # Convert to WAV using ffmpeg
     temp_wav_path = os.path.join(temp_dir, f"{input_path.stem}_temp.wav")
+
+    # libsndfile >= 1.1 decodes MP3 itself: transcode in-process rather than spawning ffmpeg
+    if input_path.suffix.lower() == '.mp3' and 'MP3' in sf.available_formats():
+        print(f"    🔄 Decoding MP3 to WAV in-process...")
+        try:
+            with sf.SoundFile(str(input_path)) as src, \
+                    sf.SoundFile(temp_wav_path, "w", src.samplerate, src.channels, subtype="PCM_16") as dst:
+                for block in src.blocks(blocksize=BLOCK_SIZE, dtype="int16"):
+                    _check_cancelled(cancel)
+                    dst.write(block)
+            print(f"    ✅ Conversion completed: {temp_wav_path}")
+            return temp_wav_path
+        except RuntimeError as e:
+            print(f"    ⚠️  In-process MP3 decode failed ({e}), falling back to ffmpeg")
+
+    # With PyAV installed, decode in-process and skip the ffmpeg fork and codec start-up
+    if av is not None:
+        print(f"    🔄 Decoding {input_path.suffix} to WAV in-process...")
+        try:
+            wav = _pcm_to_wav(_decode_with_av(input_path), temp_wav_path, cancel)
+            print(f"    ✅ Conversion completed: {'in memory' if isinstance(wav, io.BytesIO) else wav}")
+            return wav
+        except av.error.FFmpegError as e:
+            print(f"    ⚠️  In-process decode failed ({e}), falling back to ffmpeg")
+        except IndexError:
+            print("    ⚠️  In-process decode found no audio stream, falling back to ffmpeg")
+
+    # Convert to WAV using ffmpeg
     print(f"    🔄 Converting {input_path.suffix} to WAV...")
     
     try:
-        # Use ffmpeg to convert to WAV
+        # Use ffmpeg to decode to raw PCM on stdout; it is wrapped in a WAV here, so no
+        # intermediate file is written unless the audio is too long to keep in memory
         cmd = [
             'ffmpeg', 
+            '-nostdin',              # Never read the terminal (several conversions may run at once)
+            '-hide_banner',
+            '-loglevel', 'error',    # stderr only carries what is worth reporting on failure
+            '-threads', '0',         # Let the decoder use every core
             '-i', str(input_path),
+            '-vn', '-sn', '-dn',     # Skip video, subtitle and data streams in MP4/MOV inputs
             '-acodec', 'pcm_s16le',  # 16-bit PCM
             '-ar', '44100',          # 44.1kHz sample rate
             '-ac', '2',              # Stereo
-            '-y',                    # Overwrite output file
-            temp_wav_path
+            '-f', 's16le',           # Headerless, so nothing needs patching afterwards
+            'pipe:1'
         ]
         
         print(f"    ⚙️  Running ffmpeg command...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"    ❌ ffmpeg conversion failed: {result.stderr}")
-            raise subprocess.CalledProcessError(result.returncode, cmd, result.stderr)
+        # stderr goes to a file rather than a pipe so a chatty ffmpeg can't block on it
+        # while we are still reading stdout. It is kept as raw bytes and only decoded if
+        # the conversion fails.
+        with tempfile.TemporaryFile(dir=temp_dir) as err:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err)
+            try:
+                with proc.stdout:
+                    wav = _pcm_to_wav(_read_pcm_frames(proc.stdout), temp_wav_path, cancel)
+            except BaseException:
+                # Cancelled, or we failed to consume the output: don't let ffmpeg run on
+                proc.kill()
+                raise
+            finally:
+                returncode = proc.wait()
+            if returncode != 0:
+                err.seek(0)
+                stderr = err.read().decode(errors="replace")
+                print(f"    ❌ ffmpeg conversion failed: {stderr}")
+                raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
         
-        print(f"    ✅ Conversion completed: {temp_wav_path}")
-        return temp_wav_path
+        print(f"    ✅ Conversion completed: {'in memory' if isinstance(wav, io.BytesIO) else wav}")
+        return wav
+    except _ConversionCancelled:
+        raise
     except FileNotFoundError:
         raise ValueError("ffmpeg not found. Please install ffmpeg to convert audio/video files.")
     except subprocess.CalledProcessError as e:
@@ -69,7 +184,218 @@ def _convert_to_wav(input_path: str, temp_dir: str) -> str:
     except Exception as e:
         raise ValueError(f"Failed to convert {input_path} to WAV: {str(e)}")
 
-def smart_mute(file_path: str, api_token: str, base_url: str = "https://groovy.audioshake.ai") -> str:
+def _decode_with_av(input_path: Path) -> Iterator[bytes]:
+    """Decode the first audio stream of *input_path* with PyAV, yielding 16-bit 44.1kHz stereo PCM."""
+    with av.open(str(input_path)) as container:
+        stream = container.streams.audio[0]
+        resampler = av.AudioResampler(format="s16", layout="stereo", rate=44100)
+        for frame in container.decode(stream):
+            for out in resampler.resample(frame):
+                yield out.to_ndarray().tobytes()
+        # Drain whatever the resampler is still holding
+        for out in resampler.resample(None):
+            yield out.to_ndarray().tobytes()
+
+def _read_pcm_frames(pipe: BinaryIO) -> Iterator[bytes]:
+    """
+    Yield 16-bit stereo PCM from *pipe* as soon as it arrives, cut to whole frames.
+
+    ``read1`` hands back whatever ffmpeg has written so far instead of blocking until a full
+    ``PIPE_READ_SIZE`` is available, so a cancelled conversion is noticed promptly.
+    """
+    rest = b""
+    for chunk in iter(lambda: pipe.read1(PIPE_READ_SIZE), b""):
+        if rest:
+            chunk = rest + chunk
+        whole = len(chunk) - len(chunk) % 4
+        rest = chunk[whole:]
+        if whole:
+            yield chunk[:whole]
+
+def _pcm_to_wav(chunks: Iterable[bytes], temp_wav_path: str, cancel: threading.Event = None) -> Union[str, io.BytesIO]:
+    """
+    Wrap a stream of raw 16-bit 44.1kHz stereo PCM chunks in a WAV.
+
+    The WAV is built in memory; if it grows past ``IN_MEMORY_WAV_MAX`` it is moved to
+    *temp_wav_path* and the rest of the stream is appended there instead. Setting *cancel*
+    stops it between chunks.
+
+    Returns
+    -------
+    str or io.BytesIO
+        The in-memory WAV (rewound), or *temp_wav_path* if it spilled to disk.
+    """
+    buf = io.BytesIO()
+    dst = sf.SoundFile(buf, "w", 44100, 2, "PCM_16", format="WAV")
+    try:
+        for chunk in chunks:
+            _check_cancelled(cancel)
+            if buf is not None and buf.tell() + len(chunk) > IN_MEMORY_WAV_MAX:
+                dst.close()
+                with open(temp_wav_path, "wb") as f:
+                    f.write(buf.getbuffer())
+                buf = None
+                dst = sf.SoundFile(temp_wav_path, "r+")
+                dst.seek(0, sf.SEEK_END)
+            dst.buffer_write(chunk, dtype="int16")
+    finally:
+        dst.close()
+    if buf is None:
+        return temp_wav_path
+    buf.seek(0)
+    return buf
+
+def _process_wav(client: AudioShakeClient, wav: Union[str, io.BytesIO], filename: str, metadata: dict, output_dir: str, **kwargs) -> dict:
+    """Run one job on the converted WAV, whether it is a path on disk or an in-memory buffer."""
+    if isinstance(wav, io.BytesIO):
+        try:
+            return client.process_job_from_buffer(wav, filename, metadata=metadata, output_dir=output_dir, **kwargs)
+        finally:
+            # Leave the buffer ready for the next reader
+            wav.seek(0)
+    return client.process_job(file_path=wav, metadata=metadata, output_dir=output_dir, **kwargs)
+
+def _merge_events(events: list, max_gap: float = MERGE_GAP_SECONDS) -> list:
+    """
+    Coalesce overlapping music events, and events less than *max_gap* seconds apart.
+
+    Each merged event costs one upload/job/download round-trip instead of several, and
+    gives the separation model more context.
+
+    Returns
+    -------
+    list
+        New event dicts sorted by ``start_time``; *events* is left untouched.
+    """
+    merged = []
+    for ev in sorted(events, key=lambda e: e["start_time"]):
+        if merged and ev["start_time"] - merged[-1]["end_time"] < max_gap:
+            merged[-1]["end_time"] = max(merged[-1]["end_time"], ev["end_time"])
+        else:
+            merged.append({"start_time": ev["start_time"], "end_time": ev["end_time"]})
+    return merged
+
+def _check_spliceable(result_sr: int, result_channels: int, sr: int, channels: int) -> None:
+    """
+    Refuse a music-removal result that can't be spliced into the source.
+
+    Results are spliced by sample index, which only lines up if they have the source's
+    sample rate and channel count.
+
+    Raises
+    ------
+    RuntimeError
+        If the rate or channel count differs from the source.
+    """
+    if (result_sr, result_channels) != (sr, channels):
+        raise RuntimeError(
+            f"Music removal returned {result_sr}Hz/{result_channels}ch audio "
+            f"for a {sr}Hz/{channels}ch input; cannot splice it"
+        )
+
+def _remove_music_from_slice(
+    client: AudioShakeClient,
+    audio_slice: np.ndarray,
+    sr: int,
+    index: int,
+    cache_path: str = None,
+    cancel: threading.Event = None,
+) -> np.ndarray:
+    """
+    Run music removal on a single slice of audio.
+
+    Parameters
+    ----------
+    client : AudioShakeClient
+        Client used to upload the slice and run the job.
+    audio_slice : np.ndarray
+        Samples of the music region.
+    sr : int
+        Sample rate of *audio_slice*.
+    index : int
+        Index of the segment, used to name the upload.
+    cache_path : str, optional
+        Where this segment's result is cached; reused instead of running the job if present.
+    cancel : threading.Event, optional
+        Set by the caller to abandon the job, e.g. once another segment has failed.
+
+    Returns
+    -------
+    np.ndarray
+        The slice with music removed.
+    """
+    from_cache = bool(cache_path) and os.path.exists(cache_path)
+    if from_cache:
+        print(f"    ♻️  Using cached music removal for segment {index+1}")
+        with open(cache_path, "rb") as f:
+            output_bytes = f.read()
+    else:
+        # Encode slice as an in-memory WAV
+        slice_name = f"slice_{index:03d}.wav"
+        slice_buf = io.BytesIO()
+        sf.write(slice_buf, audio_slice, sr, format="WAV", subtype="PCM_16")
+        slice_buf.seek(0)
+
+        print(f"    🎼 Removing music from segment {index+1}...")
+        remove_result = client.process_job_from_buffer(
+            slice_buf,
+            slice_name,
+            metadata={"name": "music_removal", "format": "wav"},
+            in_memory=True,
+            cancel=cancel,
+        )
+        output_bytes = remove_result["output_bytes"][0]
+    # Decode the stripped slice straight from the response body
+    with sf.SoundFile(io.BytesIO(output_bytes)) as result:
+        channels = 1 if audio_slice.ndim == 1 else audio_slice.shape[1]
+        _check_spliceable(result.samplerate, result.channels, sr, channels)
+        stripped_audio = result.read(dtype=audio_slice.dtype)
+    # Only cache results that could actually be used
+    if cache_path and not from_cache:
+        _write_cache(cache_path, output_bytes)
+    print(f"    ✅ Music removal completed for segment {index+1} ({len(stripped_audio)} samples)")
+    return stripped_audio
+
+def _segment_result(target: Future, outstanding: Collection[Future]) -> np.ndarray:
+    """
+    Wait for *target*'s result, but raise as soon as any of the *outstanding* futures fails
+    rather than only once the writer reaches the failed segment.
+    """
+    pending = set(outstanding) | {target}
+    while True:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for f in done:
+            if f is not target and not f.cancelled() and f.exception() is not None:
+                raise f.exception()
+        if target.done():
+            return target.result()
+
+def _native_dtype(subtype: str) -> str:
+    """Pick the narrowest NumPy dtype that holds samples of a libsndfile *subtype* without loss."""
+    if subtype == "PCM_16":
+        return "int16"
+    if subtype in ("PCM_24", "PCM_32"):
+        return "int32"
+    return "float32"
+
+def _copy_frames(src: sf.SoundFile, dst: sf.SoundFile, start: int, stop: int, dtype: str) -> None:
+    """Copy frames ``[start, stop)`` from *src* to *dst* one block at a time."""
+    if stop <= start:
+        return
+    src.seek(start)
+    # Every block is decoded into the same buffer instead of a freshly allocated array
+    buf = np.empty((min(BLOCK_SIZE, stop - start), src.channels), dtype=dtype)
+    for block in src.blocks(frames=stop - start, out=buf):
+        dst.write(block)
+
+def smart_mute(
+    file_path: str,
+    api_token: str,
+    base_url: str = "https://groovy.audioshake.ai",
+    single_pass: bool = False,
+    client: AudioShakeClient = None,
+    use_cache: bool = False,
+) -> str:
     """
     Detects music segments in the given audio/video file, removes the music, and re‑assembles the audio.
     The processed file is written next to the original with ``_smart_mute`` appended to the stem.
@@ -83,6 +409,18 @@ def smart_mute(file_path: str, api_token: str, base_url: str = "https://groovy.a
         AudioShake API token.
     base_url : str, optional
         Alternate base URL for the AudioShake service.
+    single_pass : bool, optional
+        Run music removal once over the whole file and splice the detected regions from it,
+        instead of one job per segment. Fewer jobs and more context for the model, but the
+        entire file is processed even if music covers little of it.
+    client : AudioShakeClient, optional
+        Already validated client to use instead of creating one, so that several files
+        processed at once share its connection pool. *api_token* and *base_url* are ignored
+        when it is given.
+    use_cache : bool, optional
+        Reuse detection results and per-segment outputs cached in ``CACHE_DIR`` by earlier
+        runs on the same input, and cache new ones there. Off by default: the cache holds
+        copies of the processed audio and is never pruned.
 
     Raises
     ------
@@ -96,113 +434,196 @@ def smart_mute(file_path: str, api_token: str, base_url: str = "https://groovy.a
 
     print(f"🎵 Starting Smart Mute processing for: {file_path}")
     
-    path = Path(file_path).expanduser().resolve()
-    if not path.exists():
-        raise FileNotFoundError(f"{path} not found")
+    # Cheap string check first; the filesystem is only touched once the format is supported
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in SUPPORTED_EXTS:
+        raise ValueError(f"Unsupported file format: {ext}. Supported formats: {', '.join(SUPPORTED_EXTS)}")
 
-    # Check file size before processing
-    file_size_mb = path.stat().st_size / (1024 * 1024)
-    print(f"📁 Input file size: {file_size_mb:0.2} MB")
-
-    # Initialise AudioShake client
-    print("🔧 Initializing AudioShake client...")
-    client = AudioShakeClient(api_token, base_url=base_url)
-
-    # Validate API connection before processing
-    print("🔍 Validating AudioShake API connection...")
+    file_path = os.path.expanduser(file_path)
     try:
-        client.validate_connection()
-        print("✅ API connection validated successfully")
-    except Exception as e:
-        print(f"❌ API validation failed: {str(e)}")
-        raise
+        # Check file size before processing (one stat doubles as the existence check)
+        file_size = os.stat(file_path).st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{file_path} not found")
+    path = Path(file_path)
+    print(f"📁 Input file size: {file_size / (1024 * 1024):0.2} MB")
+    # Keys this input's cache entries; a changed file gets a new key
+    fingerprint = _file_fingerprint(file_path) if use_cache else None
 
     music_detect_meta = {"name": "music_detection", "format": "json"}
+    music_removal_meta = {"name": "music_removal", "format": "wav"}
 
     # Temporary workspace
     print("📁 Creating temporary workspace...")
     temp_dir = tempfile.mkdtemp(prefix="smart_mute_")
     print(f"✅ Temporary directory created: {temp_dir}")
+    # A client created here is closed here; a shared one belongs to the caller
+    owns_client = client is None
     
     try:
-        # Convert input file to WAV if necessary
+        # Convert input file to WAV if necessary. The conversion is local and the validation
+        # below is a network round-trip, so the two run side by side.
         print("🔄 Converting input file to WAV format...")
-        wav_path = _convert_to_wav(str(path), temp_dir)
-        print(f"✅ File converted to WAV: {wav_path}")
+        # If validation fails, the conversion is cancelled rather than waited for.
+        cancel_conversion = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as converter:
+            conversion = converter.submit(_convert_to_wav, str(path), temp_dir, cancel_conversion)
+            try:
+                # Initialise AudioShake client, unless the caller shares one across files
+                if client is None:
+                    print("🔧 Initializing AudioShake client...")
+                    client = AudioShakeClient(api_token, base_url=base_url)
+
+                    # Validate API connection before processing
+                    print("🔍 Validating AudioShake API connection...")
+                    try:
+                        client.validate_connection()
+                        print("✅ API connection validated successfully")
+                    except Exception as e:
+                        print(f"❌ API validation failed: {str(e)}")
+                        raise
+
+                wav = conversion.result()
+            except BaseException:
+                cancel_conversion.set()
+                raise
+        in_memory_wav = isinstance(wav, io.BytesIO)
+        print(f"✅ File converted to WAV: {'in memory' if in_memory_wav else wav}")
 
         # 1. Detect music regions
         print("\n🎼 STEP 1: Detecting music regions...")
-        print(f"📤 Sending music detection job for: {wav_path}")
-        detect_result = client.process_job(
-            file_path=wav_path,
-            metadata=music_detect_meta,
-            output_dir=temp_dir,
-        )
-        print(f"✅ Music detection completed. Output: {detect_result['output_path']}")
-        
-        with open(detect_result["output_path"], "r") as fp:
-            events = json.load(fp)
-        print(f"📊 Found {len(events)} music segments to process")
-
-        # 2. Read original audio (read‑only copy)
-        print("\n📖 STEP 2: Loading original audio...")
-        original_audio, sr = sf.read(wav_path)
-        processed_audio = np.copy(original_audio)
-        print(f"✅ Audio loaded: {len(original_audio)} samples at {sr}Hz ({len(original_audio)/sr:.2f}s duration)")
-
-        # 3. For each detected region, remove music
-        print(f"\n🎵 STEP 3: Processing {len(events)} music segments...")
-        for i, ev in enumerate(events):
-            start_time = ev["start_time"]
-            end_time = ev["end_time"]
-            duration = end_time - start_time
-            
-            print(f"\n  🎵 Processing segment {i+1}/{len(events)}: {start_time:.2f}s - {end_time:.2f}s (duration: {duration:.2f}s)")
-            
-            start_smp = int(start_time * sr)
-            end_smp = int(end_time * sr)
-
-            # Write slice to temp file
-            slice_path = os.path.join(temp_dir, f"slice_{i:03d}.wav")
-            print(f"    📁 Creating slice file: {slice_path}")
-            sf.write(slice_path, processed_audio[start_smp:end_smp], sr)
-
-            # Run music‑removal on slice
-            print(f"    🎼 Removing music from segment {i+1}...")
-            remove_result = client.process_job(
-                file_path=slice_path,
-                metadata={"name": "music_removal", "format": "wav"},
-                output_dir=temp_dir,
-            )
-            print(f"    ✅ Music removal completed for segment {i+1}")
-            
-            stripped_audio, _ = sf.read(remove_result["output_path"])
-            print(f"    📊 Stripped audio: {len(stripped_audio)} samples")
-
-            # Replace region, padding/truncating if lengths differ
-            target_len = end_smp - start_smp
-            if stripped_audio.shape[0] != target_len:
-                min_len = min(stripped_audio.shape[0], target_len)
-                print(f"    ⚠️  Length mismatch: target={target_len}, actual={stripped_audio.shape[0]}, using {min_len}")
-                processed_audio[start_smp:start_smp + min_len] = stripped_audio[:min_len]
-                if min_len < target_len:
-                    processed_audio[start_smp + min_len:end_smp] = 0
-                    print(f"    🔇 Padding remaining {target_len - min_len} samples with silence")
-            else:
-                processed_audio[start_smp:end_smp] = stripped_audio
-                print(f"    ✅ Segment {i+1} replaced successfully")
-
-        # 4. Save the re‑assembled file next to original (always as WAV)
-        print(f"\n💾 STEP 4: Saving final output...")
-        output_path = path.with_stem(f"{path.stem}_smart_mute").with_suffix('.wav')
-        print(f"📁 Writing output to: {output_path}")
-        sf.write(str(output_path), processed_audio, sr)
+        events_cache = os.path.join(CACHE_DIR, f"{fingerprint}.events.json") if fingerprint else None
+        if events_cache and os.path.exists(events_cache):
+            print(f"♻️  Using cached music detection results: {events_cache}")
+            with open(events_cache, "r") as fp:
+                events = json.load(fp)
+        else:
+            print(f"📤 Sending music detection job for: {path.stem + '.wav (in memory)' if in_memory_wav else wav}")
+            detect_result = _process_wav(client, wav, f"{path.stem}.wav", music_detect_meta, temp_dir, inline_json=True)
+            print(f"✅ Music detection completed")
+
+            # Small detection results come back inline; larger ones are downloaded to temp_dir
+            events = detect_result.get("output_data")
+            if events is None:
+                with open(detect_result["output_path"], "r") as fp:
+                    events = json.load(fp)
+            if events_cache:
+                _write_cache(events_cache, json.dumps(events).encode())
+        print(f"📊 Found {len(events)} music segments")
+        events = _merge_events(events)
+        print(f"📊 {len(events)} segments to process after merging nearby ones")
+
+        # In single-pass mode the whole file goes through music removal once, and the detected
+        # regions are spliced in from that result instead of running one job per segment
+        full_removal_path = None
+        if single_pass and events:
+            print("\n🎼 Removing music from the full audio in a single pass...")
+            removal_result = _process_wav(client, wav, f"{path.stem}.wav", music_removal_meta, temp_dir)
+            full_removal_path = removal_result["output_path"]
+            print(f"✅ Full-audio music removal completed")
+
+        # 2. Open original audio for streaming; only the music regions are decoded up front
+        print("\n📖 STEP 2: Opening original audio...")
+        with sf.SoundFile(wav) as src, \
+                (sf.SoundFile(full_removal_path) if full_removal_path else contextlib.nullcontext()) as full_removal:
+            sr = src.samplerate
+            total_samples = src.frames
+            # Keep samples in their native width rather than float64
+            dtype = _native_dtype(src.subtype)
+            print(f"✅ Audio opened: {total_samples} samples at {sr}Hz ({total_samples/sr:.2f}s duration)")
+            if full_removal is not None:
+                _check_spliceable(full_removal.samplerate, full_removal.channels, sr, src.channels)
+
+            # 3. Map every detected region to samples; music removal runs concurrently below
+            print(f"\n🎵 STEP 3: Processing {len(events)} music segments...")
+            segments = []
+            for i, ev in enumerate(events):
+                start_time = ev["start_time"]
+                end_time = ev["end_time"]
+                duration = end_time - start_time
+
+                print(f"  🎵 Segment {i+1}/{len(events)}: {start_time:.2f}s - {end_time:.2f}s (duration: {duration:.2f}s)")
+                start_smp, end_smp = min(int(start_time * sr), total_samples), min(int(end_time * sr), total_samples)
+                # Merged events are sorted and disjoint; only ones lying past the end of the audio drop out
+                if end_smp > start_smp:
+                    segments.append((start_smp, end_smp))
+
+            # 4. Save the re‑assembled file next to original (always as WAV) in one streaming
+            #    pass. Segments are written in order as their jobs finish, so untouched audio is
+            #    block-copied from the source while later segments are still being processed.
+            output_path = path.with_stem(f"{path.stem}_smart_mute").with_suffix('.wav')
+            # Written under a temporary name and moved into place once complete, so a failed
+            # run never leaves a truncated output behind
+            partial_path = f"{output_path}.part"
+            workers = max(1, min(len(segments), MAX_SEGMENT_WORKERS))
+            pool = ThreadPoolExecutor(max_workers=workers)
+            # Set on failure so jobs still being polled give up instead of running to completion
+            cancel = threading.Event()
+            try:
+                print(f"\n💾 STEP 4: Writing output to: {output_path}")
+                # libsndfile converts non-int16 samples to PCM_16 through a small internal buffer
+                # and issues one write() per 8 KiB; going through a buffered file object turns
+                # those into 1 MiB writes
+                with open(partial_path, "wb", buffering=WRITE_BUFFER_SIZE) as out_file, \
+                        sf.SoundFile(out_file, "w", sr, src.channels, subtype="PCM_16", format="WAV") as out:
+                    futures = {}
+                    submitted = 0
+                    cursor = 0
+                    for i, (start_smp, end_smp) in enumerate(segments):
+                        # Slices are read and submitted lazily, a bounded window ahead of the
+                        # writer, so only a few segments are ever held in memory at once
+                        while full_removal is None and submitted < min(i + 2 * workers, len(segments)):
+                            k = submitted
+                            src.seek(segments[k][0])
+                            audio_slice = src.read(segments[k][1] - segments[k][0], dtype=dtype)
+                            cache_path = (
+                                os.path.join(CACHE_DIR, f"{fingerprint}_{sr}_{segments[k][0]}_{segments[k][1]}.wav")
+                                if fingerprint else None
+                            )
+                            futures[k] = pool.submit(_remove_music_from_slice, client, audio_slice, sr, k, cache_path, cancel)
+                            submitted += 1
+
+                        # Untouched audio up to this segment, written while its job may still be running
+                        _copy_frames(src, out, cursor, start_smp, dtype)
+                        if full_removal is None:
+                            stripped_audio = _segment_result(futures.pop(i), futures.values())
+                        else:
+                            full_removal.seek(min(start_smp, full_removal.frames))
+                            stripped_audio = full_removal.read(end_smp - start_smp, dtype=dtype)
+
+                        # Pad/truncate if lengths differ. The result is written straight out
+                        # rather than copied into a fitted array: a long result is written as a
+                        # view, and a short one is followed by just the missing silence.
+                        target_len = end_smp - start_smp
+                        min_len = min(stripped_audio.shape[0], target_len)
+                        if stripped_audio.shape[0] != target_len:
+                            print(f"    ⚠️  Segment {i+1} length mismatch: target={target_len}, actual={stripped_audio.shape[0]}, using {min_len}")
+                        out.write(stripped_audio[:min_len])
+                        if min_len < target_len:
+                            print(f"    🔇 Padding remaining {target_len - min_len} samples with silence")
+                            out.write(np.zeros((target_len - min_len,) + stripped_audio.shape[1:], dtype=stripped_audio.dtype))
+                        cursor = end_smp
+                        print(f"    ✅ Segment {i+1} replaced successfully")
+
+                    _copy_frames(src, out, cursor, total_samples, dtype)
+                os.replace(partial_path, output_path)
+            except BaseException:
+                # Don't start segment jobs still queued behind a failure, tell running ones to
+                # stop polling, and don't wait for them before reporting the error
+                cancel.set()
+                pool.shutdown(wait=False, cancel_futures=True)
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+                raise
+            pool.shutdown()
         print(f"✅ Smart mute processing completed successfully!")
         print(f"🎉 Output saved to: {output_path}")
 
         return str(output_path)
 
     finally:
+        if owns_client and client is not None:
+            client.close()
         # Clean up temporary directory
         print(f"\n🧹 Cleaning up temporary files...")
         shutil.rmtree(temp_dir, ignore_errors=True)
@@ -225,38 +646,71 @@ if __name__ == "__main__":
         default="https://groovy.audioshake.ai",
         help="Override the AudioShake base URL if needed",
     )
+    parser.add_argument(
+        "--single_pass",
+        action="store_true",
+        help="Remove music from the whole file in one job instead of one job per detected segment",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse and store detection and music removal results in {CACHE_DIR}",
+    )
     args = parser.parse_args()
 
+    # Surface the client's progress messages (per-poll status stays at DEBUG)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Get API token from command line argument or environment variable
     api_token = args.api_token or os.getenv('AUDIOSHAKE_TOKEN')
     if not api_token:
         print("❌  Error: API token is required. Provide it as an argument or set AUDIOSHAKE_TOKEN environment variable.", file=sys.stderr)
         sys.exit(1)
 
-    SUPPORTED_EXTS = {'.wav', '.mp3', '.m4a', '.mp4', '.mov'}
-
     input_path = Path(args.file_path).expanduser().resolve()
     if input_path.is_dir():
         # Directory mode: process all supported files in the directory (non-recursive)
-        files = [f for f in input_path.iterdir() if f.is_file() and f.suffix.lower() in SUPPORTED_EXTS]
+        # scandir's entries answer is_file() from the directory listing itself, and the cheap
+        # extension check runs first, so most entries cost no extra stat
+        with os.scandir(input_path) as entries:
+            files = [
+                Path(e.path) for e in entries
+                if os.path.splitext(e.name)[1].lower() in SUPPORTED_EXTS and e.is_file()
+            ]
         if not files:
             print(f"❌  No supported audio/video files found in directory: {input_path}", file=sys.stderr)
             sys.exit(1)
         print(f"🔎 Found {len(files)} supported files in directory: {input_path}")
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        # One client for every file, so all workers share its keep-alive connections
+        client = AudioShakeClient(api_token, base_url=args.base_url)
+        try:
+            client.validate_connection()
+        except Exception as exc:
+            client.close()
+            print(f"❌  API validation failed: {exc}", file=sys.stderr)
+            sys.exit(1)
         results = []
         errors = []
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_file = {executor.submit(smart_mute, str(f), api_token, args.base_url): f for f in files}
-            for future in as_completed(future_to_file):
-                f = future_to_file[future]
-                try:
-                    output = future.result()
-                    print(f"✅  Process complete. Output written to: {output}")
-                    results.append((f, output))
-                except Exception as exc:
-                    print(f"❌  Error processing {f}: {exc}", file=sys.stderr)
-                    errors.append((f, exc))
+        try:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                future_to_file = {
+                    executor.submit(
+                        smart_mute, str(f), api_token, args.base_url, args.single_pass,
+                        client=client, use_cache=args.cache,
+                    ): f
+                    for f in files
+                }
+                for future in as_completed(future_to_file):
+                    f = future_to_file[future]
+                    try:
+                        output = future.result()
+                        print(f"✅  Process complete. Output written to: {output}")
+                        results.append((f, output))
+                    except Exception as exc:
+                        print(f"❌  Error processing {f}: {exc}", file=sys.stderr)
+                        errors.append((f, exc))
+        finally:
+            client.close()
         print(f"\n🎉 Finished processing directory. {len(results)} succeeded, {len(errors)} failed.")
         if errors:
             print("Failed files:")
@@ -266,7 +720,10 @@ if __name__ == "__main__":
     else:
         # Single file mode (existing behavior)
         try:
-            output = smart_mute(str(input_path), api_token=api_token, base_url=args.base_url)
+            output = smart_mute(
+                str(input_path), api_token=api_token, base_url=args.base_url,
+                single_pass=args.single_pass, use_cache=args.cache,
+            )
             print(f"✅  Process complete. Output written to: {output}")
         except Exception as exc:
             print("❌  An error occurred while processing:", file=sys.stderr)